@@ -1,9 +1,8 @@
 """ Implementation of abstract Disposable.
 """
-from abc import ABCMeta, abstractmethod
 
 
-class Disposable(metaclass=ABCMeta):
+class Disposable:
     """
     Implementation of the disposable pattern. A disposable is usually
     returned on resource allocation. Calling .dispose() on the returned
@@ -21,9 +20,11 @@ class Disposable(metaclass=ABCMeta):
         working
         DISPOSED
     """
-    @abstractmethod
+    __slots__ = ()
+
     def dispose(self) -> None:
         """ .dispose() method has to be overwritten"""
+        raise NotImplementedError('.dispose() has to be implemented')
 
     def __enter__(self):
         """ Called on entry of a new context """
@@ -0,0 +1,103 @@
+"""
+Collect the emits of one event loop iteration and emit them at once.
+
+Usage:
+
+>>> import asyncio
+>>> from broqer import Value, op, Sink
+>>> v = Value()
+>>> batch_publisher = v | op.Batch()
+>>> _d = batch_publisher.subscribe(Sink(print))
+>>> v.emit(1)
+>>> v.emit(2)
+>>> asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+(1, 2)
+>>> v.emit(3)
+>>> asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+(3,)
+>>> _d.dispose()
+
+With ``coalesce=True`` only the last value of the batch is emitted:
+
+>>> _d = (v | op.Batch(coalesce=True)).subscribe(Sink(print))
+>>> v.emit(4)
+>>> v.emit(5)
+>>> asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+5
+>>> _d.dispose()
+"""
+import asyncio
+import sys
+from typing import Any, List, Optional  # noqa: F401
+
+from broqer import Publisher, Subscriber, default_error_handler
+
+from broqer.operator import Operator, OperatorFactory
+
+
+class AppliedBatch(Operator):
+    """ Collect the emits of one event loop iteration and emit them at once.
+    :param coalesce: emit only the last collected value instead of a tuple
+    :param error_callback: the error callback to be registered
+    :param loop: asyncio event loop to use
+    """
+    __slots__ = ('_coalesce', '_loop', '_call_soon_handler', '_pending',
+                 '_error_callback')
+
+    def __init__(self, publisher: Publisher, coalesce: bool = False,
+                 error_callback=default_error_handler, loop=None) -> None:
+
+        Operator.__init__(self, publisher)
+
+        self._coalesce = coalesce
+        self._loop = loop or asyncio.get_event_loop()
+        self._call_soon_handler = None  # type: Optional[asyncio.Handle]
+        self._pending = []  # type: List[Any]
+        self._error_callback = error_callback
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        Operator.unsubscribe(self, subscriber)
+
+        if not self._subscriptions:
+            # drop a collected batch when the last subscriber is gone
+            if self._call_soon_handler is not None:
+                self._call_soon_handler.cancel()
+                self._call_soon_handler = None
+            self._pending.clear()
+
+    def emit(self, value: Any, who: Publisher) -> None:
+        if who is not self._orginator:
+            raise ValueError('Emit from non assigned publisher')
+
+        if self._coalesce:
+            self._pending.clear()
+
+        self._pending.append(value)
+
+        # schedule the flush only for the first value of a batch
+        if self._call_soon_handler is None:
+            self._call_soon_handler = self._loop.call_soon(self._flush)
+
+    def _flush(self):
+        self._call_soon_handler = None
+        values, self._pending = self._pending, []
+
+        try:
+            if self._coalesce:
+                Publisher.notify(self, values[-1])
+            else:
+                Publisher.notify(self, tuple(values))
+        except Exception:  # pylint: disable=broad-except
+            self._error_callback(*sys.exc_info())
+
+
+class Batch(OperatorFactory):  # pylint: disable=too-few-public-methods
+    """ Collect the emits of one event loop iteration and emit them at once.
+    The collected values are emitted as tuple.
+    :param coalesce: emit only the last collected value instead of a tuple
+    """
+    def __init__(self, coalesce: bool = False) -> None:
+        self._coalesce = coalesce
+
+    def apply(self, publisher: Publisher):
+        return AppliedBatch(publisher, self._coalesce)
@@ -22,6 +22,8 @@ class BitwiseCombineLatest(MultiOperator):
                                   publisher as value
     :param init: optional init value used for undefined bits (or initial state)
     """
+    __slots__ = ('_init', '_missing', '_publisher_bit_mapping')
+
     def __init__(self, publisher_bit_mapping: Dict, init: int = 0) -> None:
         MultiOperator.__init__(self, *publisher_bit_mapping)
 
@@ -68,15 +70,15 @@ class BitwiseCombineLatest(MultiOperator):
         return state
 
     def emit(self, value: Any, who: Publisher) -> None:
-        if all(who is not p for p in self._orginators):
+        bit_index = self._publisher_bit_mapping.get(who, None)
+
+        if bit_index is None:
             raise ValueError('Emit from non assigned publisher')
 
         # remove source publisher from ._missing
         self._missing.discard(who)
 
         # evaluate
-        bit_index = self._publisher_bit_mapping[who]
-
         if self._state is NONE:
             self._state = self._init
 
@@ -39,6 +39,9 @@ class CombineLatest(MultiOperator):
         emit comes from one of this list. If None, emit on any source
         publisher.
     """
+    __slots__ = ('_partial_state', '_index', '_all_missing', '_missing',
+                 '_emit_on', '_map')
+
     def __init__(self, *publishers: Publisher, map_: Callable[..., Any] = None,
                  emit_on=None) -> None:
         MultiOperator.__init__(self, *publishers)
@@ -49,31 +52,39 @@ class CombineLatest(MultiOperator):
         self._partial_state = [
             NONE for _ in publishers]  # type: MutableSequence[Any]
 
-        # ._missing is keeping a set of source publishers which are required to
-        # emit a value. This set starts with all source publishers. Stateful
-        # publishers are required, stateless publishers not (will be removed
-        # in .subscribe).
-        self._missing = set(publishers)
-
         # ._index is a lookup table to get the list index based on publisher
         self._index = \
             {p: i for i, p in enumerate(publishers)
              }  # type: Dict[Publisher, int]
 
-        # .emit_on is a set of publishers. When a source publisher is emitting
-        # and is not in this set the CombineLatest will not emit a value.
-        # If emit_on is None all the publishers will be in the set.
-        if isinstance(emit_on, Publisher):
-            self._emit_on = (emit_on,)
+        # ._missing is a bitmask of source publishers which are required to
+        # emit a value (bit n is set while the publisher with index n has not
+        # emitted yet). It starts with all source publishers.
+        self._all_missing = sum(1 << i for i in self._index.values())
+        self._missing = self._all_missing
+
+        # ._emit_on is a bitmask of source publishers (using the same bit
+        # index as ._missing). When a source publisher is emitting and its bit
+        # is not set the CombineLatest will not emit a value.
+        # If emit_on is None the bits of all the publishers will be set.
+        if emit_on is None:
+            self._emit_on = self._all_missing
         else:
-            self._emit_on = emit_on
+            if isinstance(emit_on, Publisher):
+                emit_on = (emit_on,)
+
+            self._emit_on = 0
+
+            for publisher in emit_on:
+                if publisher in self._index:
+                    self._emit_on |= 1 << self._index[publisher]
 
         self._map = map_
 
     def unsubscribe(self, subscriber: Subscriber) -> None:
         MultiOperator.unsubscribe(self, subscriber)
         if not self._subscriptions:
-            self._missing = set(self._orginators)
+            self._missing = self._all_missing
             self._partial_state[:] = [NONE for _ in self._partial_state]
 
     def get(self):
@@ -82,7 +93,9 @@ class CombineLatest(MultiOperator):
 
         values = tuple(p.get() for p in self._orginators)
 
-        if NONE in values:
+        # `NONE in values` would compare each value for equality with NONE,
+        # which may fail for values with overloaded comparison operators
+        if any(value is NONE for value in values):
             return NONE
 
         if not self._map:
@@ -91,13 +104,15 @@ class CombineLatest(MultiOperator):
         return self._map(*values)
 
     def emit(self, value: Any, who: Publisher) -> None:
-        if all(who is not p for p in self._orginators):
+        # lookup the index of the source publisher. Publishers are hashed by
+        # identity, so this is replacing a linear search over all originators
+        index = self._index.get(who, None)
+
+        if index is None:
             raise ValueError('Emit from non assigned publisher')
 
         # remove source publisher from ._missing
-        self._missing.discard(who)
-
-        index = self._index[who]
+        self._missing &= ~(1 << index)
 
         # remember state of this source
         self._partial_state[index] = value
@@ -105,8 +120,7 @@ class CombineLatest(MultiOperator):
         # if emits from publishers are missing or source of this emit
         # is not one of emit_on -> don't evaluate and notify subscribers
 
-        if self._missing or (self._emit_on is not None and all(
-                who is not p for p in self._emit_on)):
+        if self._missing or not self._emit_on & (1 << index):
             return None
 
         # evaluate
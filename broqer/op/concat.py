@@ -1,5 +1,6 @@
 """ Concat enables concating operators """
 from broqer.operator import OperatorFactory, Publisher
+from broqer.op.map_ import Map
 
 
 class Concat(OperatorFactory):  # pylint: disable=too-few-public-methods
@@ -9,7 +10,19 @@ class Concat(OperatorFactory):  # pylint: disable=too-few-public-methods
     :param operators: the operators to concatenate
     """
     def __init__(self, *operators):
-        self._operators = operators
+        # successive Map operators are fused into one Map operator. This
+        # saves an operator (and a notification) in the resulting chain.
+        # Subclasses of Map may override .apply(), so they are not fused.
+        fused_operators = []
+
+        for operator in operators:
+            if fused_operators and type(operator) is Map and \
+                    type(fused_operators[-1]) is Map:
+                fused_operators[-1] = fused_operators[-1] | operator
+            else:
+                fused_operators.append(operator)
+
+        self._operators = tuple(fused_operators)
 
     def apply(self, publisher: Publisher) -> Publisher:
         # concat each operator in the following step
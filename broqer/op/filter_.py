@@ -34,6 +34,8 @@ from broqer.operator import Operator, OperatorFactory, OperatorMeta
 
 class AppliedFilter(Operator):
     """ Filter object applied to publisher (see Filter) """
+    __slots__ = ('_predicate', '_unpack')
+
     def __init__(self, publisher: Publisher, predicate: Callable[[Any], bool],
                  unpack: bool = False) -> None:
         Operator.__init__(self, publisher)
@@ -77,7 +79,11 @@ class Filter(OperatorFactory):  # pylint: disable=too-few-public-methods
     """
     def __init__(self, predicate: Callable[[Any], bool],
                  *args, unpack: bool = False, **kwargs) -> None:
-        self._predicate = partial(predicate, *args, **kwargs)  # type: Callable
+        if args or kwargs:
+            self._predicate = \
+                partial(predicate, *args, **kwargs)  # type: Callable
+        else:
+            self._predicate = predicate
         self._unpack = unpack
 
     def apply(self, publisher: Publisher):
@@ -90,6 +96,8 @@ class EvalTrue(Operator, metaclass=OperatorMeta):
     This operator can be used in the pipline style (v | EvalTrue) or as
     standalone operation (EvalTrue(v)).
     """
+    __slots__ = ()
+
     def __init__(self, publisher: Publisher) -> None:
         Operator.__init__(self, publisher)
 
@@ -120,6 +128,8 @@ class EvalFalse(Operator, metaclass=OperatorMeta):
 
     This operator can be used in the pipline style (v | EvalFalse or as
     standalone operation (EvalFalse(v))."""
+    __slots__ = ()
+
     def __init__(self, publisher: Publisher) -> None:
         Operator.__init__(self, publisher)
 
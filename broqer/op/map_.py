@@ -45,6 +45,8 @@ from broqer.operator import Operator, OperatorFactory
 
 class AppliedMap(Operator):
     """ Map object applied to publisher (see Map) """
+    __slots__ = ('_function', '_unpack')
+
     def __init__(self, publisher: Publisher, function: Callable[[Any], Any],
                  unpack: bool = False) -> None:
         """ Special care for return values:
@@ -99,12 +101,50 @@ class Map(OperatorFactory):  # pylint: disable=too-few-public-methods
     """
     def __init__(self, function: Callable[[Any], Any],
                  *args, unpack: bool = False, **kwargs) -> None:
-        self._function = partial(function, *args, **kwargs)
+        if args or kwargs:
+            self._function = \
+                partial(function, *args, **kwargs)  # type: Callable
+        else:
+            self._function = function
         self._unpack = unpack
 
     def apply(self, publisher: Publisher):
         return AppliedMap(publisher, self._function, self._unpack)
 
+    def __or__(self, other):
+        """ Fuse two Map operators into one: ``Map(f) | Map(g)`` is a single
+        Map operator applying ``g`` on the result of ``f``. Like two chained
+        maps the result of ``f`` will not be forwarded when it is NONE.
+        """
+        # subclasses of Map may override .apply(), so they are not fused
+        if type(self) is not Map or type(other) is not Map:
+            return NotImplemented
+
+        return Map(_fuse(self._function, self._unpack,
+                         other._function, other._unpack))
+
+
+def _fuse(first: Callable, first_unpack: bool,
+          second: Callable, second_unpack: bool) -> Callable:
+    """ Build a function applying ``second`` on the result of ``first`` """
+    def _fused(value):
+        if first_unpack:
+            assert isinstance(value, (list, tuple))
+            result = first(*value)
+        else:
+            result = first(value)
+
+        if result is NONE:
+            return NONE
+
+        if second_unpack:
+            assert isinstance(result, (list, tuple))
+            return second(*result)
+
+        return second(result)
+
+    return _fused
+
 
 def build_map(function: Callable[..., None] = None, *,
               unpack: bool = False):
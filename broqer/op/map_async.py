@@ -217,9 +217,11 @@ class AppliedMapAsync(Operator):
     def _run_coro(self, value):
         """ Start the coroutine as task """
 
-        # when LAST_DISTINCT is used only start coroutine when value changed
+        # when LAST_DISTINCT is used only start coroutine when value changed.
+        # Checking identity first is avoiding the (maybe expensive or
+        # overloaded) comparison for equality when the same object is emitted
         if self._mode is AsyncMode.LAST_DISTINCT and \
-                value == self._last_emit:
+                (value is self._last_emit or value == self._last_emit):
             self._future = None
             return
 
@@ -232,8 +234,10 @@ class AppliedMapAsync(Operator):
         # build the coroutine
         coro = self._coro(value)
 
-        # create a task out of it and add ._future_done as callback
-        self._future = asyncio.ensure_future(coro)
+        # create a task out of it and add ._future_done as callback. ._coro is
+        # always a coroutine function (see build_coro), so the task can be
+        # created directly instead of using asyncio.ensure_future
+        self._future = asyncio.get_event_loop().create_task(coro)
         self._future.add_done_callback(self._future_done)
 
 
@@ -35,6 +35,9 @@ class AppliedThrottle(Operator):
     :param error_callback: the error callback to be registered
     :param loop: asyncio event loop to use
     """
+    __slots__ = ('_duration', '_loop', '_call_later_handler', '_last_state',
+                 '_error_callback')
+
     def __init__(self, publisher: Publisher, duration: float,
                  error_callback=default_error_handler, loop=None) -> None:
 
@@ -8,7 +8,7 @@ from broqer import Publisher, SubscriptionDisposable, Subscriber
 from broqer.publisher import TValue
 
 
-class OperatorMeta(ABCMeta):
+class OperatorMeta(type):
     """ Metaclass for operators. Defining __ror__ for operator classes.
     This is e.g. used for EvalTrue: p | EvalTrue is equal to EvalTrue(p)
     """
@@ -24,6 +24,8 @@ class Operator(Publisher, Subscriber, metaclass=OperatorMeta):
     On unsubscription of the last subscriber the dependent publisher will also
     be unsubscripted.
     """
+    __slots__ = ('_orginator',)
+
     def __init__(self, publisher: Publisher) -> None:
         Publisher.__init__(self)
         Subscriber.__init__(self)
@@ -49,12 +51,12 @@ class Operator(Publisher, Subscriber, metaclass=OperatorMeta):
     def notify(self, value: TValue) -> None:
         raise ValueError('Operator doesn\'t support .notify()')
 
-    @abstractmethod
     def emit(self, value: typing.Any, who: Publisher) -> None:
         """ Send new value to the operator
         :param value: value to be send
         :param who: reference to which publisher is emitting
         """
+        raise NotImplementedError('.emit() has to be implemented')
 
 
 class OperatorFactory:
@@ -76,6 +78,8 @@ class MultiOperator(Publisher, Subscriber):
     operator. Accordingly all publishers get unsubscribed on unsubscription
     of the last subscriber.
     """
+    __slots__ = ('_orginators',)
+
     def __init__(self, *publishers: Publisher) -> None:
         Publisher.__init__(self)
         Subscriber.__init__(self)
@@ -103,9 +107,9 @@ class MultiOperator(Publisher, Subscriber):
     def notify(self, value: TValue) -> None:
         raise ValueError('Operator doesn\'t support .notify()')
 
-    @abstractmethod
     def emit(self, value: typing.Any, who: Publisher) -> None:
         """ Send new value to the operator
         :param value: value to be send
         :param who: reference to which publisher is emitting
         """
+        raise NotImplementedError('.emit() has to be implemented')
@@ -11,6 +11,8 @@ from broqer.operator import Operator
 
 class MapConstant(Operator):
     """ MapConstant TODO Docstring """
+    __slots__ = ('_value', '_operation')
+
     def __init__(self, publisher: Publisher, value, operation) -> None:
         Operator.__init__(self, publisher)
         self._value = value
@@ -33,6 +35,8 @@ class MapConstant(Operator):
 
 class MapConstantReverse(Operator):
     """ MapConstantReverse TODO """
+    __slots__ = ('_value', '_operation')
+
     def __init__(self, publisher: Publisher, value, operation) -> None:
         Operator.__init__(self, publisher)
         self._value = value
@@ -55,6 +59,8 @@ class MapConstantReverse(Operator):
 
 class MapUnary(Operator):
     """ MapUnary TODO """
+    __slots__ = ('_operation',)
+
     def __init__(self, publisher: Publisher, operation) -> None:
         Operator.__init__(self, publisher)
         self._operation = operation
@@ -75,6 +81,8 @@ class MapUnary(Operator):
 
 
 class _GetAttr(Operator):
+    __slots__ = ('_attribute_name', '_args', '_kwargs')
+
     def __init__(self, publisher: Publisher, attribute_name) -> None:
         Operator.__init__(self, publisher)
         self._attribute_name = attribute_name
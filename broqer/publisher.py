@@ -1,6 +1,7 @@
 """ Implementing Publisher """
-from typing import (TYPE_CHECKING, TypeVar, Type, Tuple, Callable, Optional,
-                    overload)
+from collections import OrderedDict
+from typing import (TYPE_CHECKING, Any, TypeVar, Type, Tuple, Callable,
+                    Optional, overload)
 
 from broqer import NONE, Disposable
 import broqer
@@ -47,12 +48,22 @@ class Publisher:
 
     :ivar _state: state of the publisher
     :ivar _inherited_type: type class for method lookup
-    :ivar _subscriptions: holding a list of subscribers
+    :ivar _subscriptions: ordered dictionary holding the subscribers (the id
+                          of the subscriber is used as key)
+    :ivar _emit_callbacks: tuple with the .emit methods of all subscribers
+                           used for notification, None when it has to be
+                           rebuilt
     :ivar _on_subscription_cb: callback with boolean as argument, telling
                                 if at least one subscription exists
     :ivar _dependencies: list with publishers this publisher is (directly or
                          indirectly) dependent on.
     """
+    # __dict__ and __weakref__ are kept to stay compatible with code setting
+    # additional attributes on a publisher (e.g. mocking .get in tests)
+    __slots__ = ('_state', '_inherited_type', '_subscriptions',
+                 '_emit_callbacks', '_on_subscription_cb',
+                 '_dependencies', '__dict__', '__weakref__')
+
     @overload  # noqa: F811
     def __init__(self, *, type_: Type[TValue] = None):
         pass
@@ -71,9 +82,12 @@ class Publisher:
         else:
             self._inherited_type = None
 
-        self._subscriptions = list()  # type: List[Subscriber]
+        self._subscriptions = \
+            OrderedDict()  # type: OrderedDict[int, Subscriber]
+        self._emit_callbacks = \
+            ()  # type: Optional[Tuple[Callable[[Any, Publisher], None], ...]]
         self._on_subscription_cb = None  # type: Optional[SubscriptionCBT]
-        self._dependencies = ()  # type: Tuple[Publisher, ...]
+        self._dependencies = list()  # type: List[Publisher]
 
     def subscribe(self, subscriber: 'Subscriber',
                   prepend: bool = False) -> 'SubscriptionDisposable':
@@ -87,24 +101,29 @@ class Publisher:
         :raises SubscriptionError: if subscriber already subscribed
         """
 
-        # `subscriber in self._subscriptions` is not working because
-        # tuple.__contains__ is using __eq__ which is overwritten and returns
-        # a new publisher - not helpful here
-        if any(subscriber is s for s in self._subscriptions):
+        # the subscribers are stored by their id. A lookup by the subscriber
+        # itself is not working because __eq__ is overwritten and returns a
+        # new publisher - not helpful here. The id is unique as long as the
+        # subscriber is referenced in the dictionary.
+        key = id(subscriber)
+
+        if key in self._subscriptions:
             raise SubscriptionError('Subscriber already registered')
 
         if not self._subscriptions and self._on_subscription_cb:
             self._on_subscription_cb(True)
 
+        self._subscriptions[key] = subscriber
+
         if prepend:
-            self._subscriptions.insert(0, subscriber)
-        else:
-            self._subscriptions.append(subscriber)
+            self._subscriptions.move_to_end(key, last=False)
+
+        self._emit_callbacks = None
 
         disposable_obj = SubscriptionDisposable(self, subscriber)
 
         if self._state is not NONE:
-            subscriber.emit(self._state, who=self)
+            subscriber.emit(self._state, self)
 
         return disposable_obj
 
@@ -114,21 +133,13 @@ class Publisher:
         :param subscriber: subscriber to unsubscribe
         :raises SubscriptionError: if subscriber is not subscribed (anymore)
         """
-        # here is a special implementation which is replacing the more
-        # obvious one: self._subscriptions.remove(subscriber) - this will not
-        # work because list.remove(x) is doing comparison for equality.
-        # Applied to publishers this will return another publisher instead of
-        # a boolean result
-        for i, _s in enumerate(self._subscriptions):
-            if _s is subscriber:
-                self._subscriptions.pop(i)
-
-                if not self._subscriptions and self._on_subscription_cb:
-                    self._on_subscription_cb(False)
+        if self._subscriptions.pop(id(subscriber), None) is None:
+            raise SubscriptionError('Subscriber is not registered')
 
-                return
+        self._emit_callbacks = None
 
-        raise SubscriptionError('Subscriber is not registered')
+        if not self._subscriptions and self._on_subscription_cb:
+            self._on_subscription_cb(False)
 
     def get(self) -> TValue:
         """ Return the state of the publisher. """
@@ -140,8 +151,21 @@ class Publisher:
         :param value: value to be emitted to subscribers
         """
         self._state = value
-        for subscriber in tuple(self._subscriptions):
-            subscriber.emit(value, who=self)
+
+        if not self._subscriptions:
+            return
+
+        # iterate over a snapshot of the .emit methods of the subscribers, so
+        # subscribing and unsubscribing during the emit is not changing the
+        # current iteration. The snapshot is only rebuilt after the
+        # subscriptions were changed.
+        emit_callbacks = self._emit_callbacks
+        if emit_callbacks is None:
+            emit_callbacks = self._emit_callbacks = tuple(
+                subscriber.emit for subscriber in self._subscriptions.values())
+
+        for emit in emit_callbacks:
+            emit(value, self)
 
     def reset_state(self) -> None:
         """ Resets the state. Calling this method will not trigger a
@@ -149,13 +173,13 @@ class Publisher:
 
         """
         self._state = NONE
-        for subscriber in tuple(self._subscriptions):
+        for subscriber in self.subscriptions:
             subscriber.reset_state()
 
     @property
     def subscriptions(self) -> Tuple['Subscriber', ...]:
         """ Property returning a tuple with all current subscribers """
-        return tuple(self._subscriptions)
+        return tuple(self._subscriptions.values())
 
     def register_on_subscription_callback(self,
                                           callback: SubscriptionCBT) -> None:
@@ -184,8 +208,13 @@ class Publisher:
         immediatly return its state as result. Otherwise it will wait forever
         until it will change its state.
         """
+        if self._state is not NONE:
+            # the first emit on subscription would be the current state, so
+            # there is no need to build a future and subscribe for it
+            return self._state
+
         future = self.as_future(timeout=None, omit_subscription=False)
-        return future.__await__()
+        return (yield from future.__await__())
 
     def as_future(self, timeout: float, omit_subscription: bool = True,
                   loop=None):
@@ -229,7 +258,7 @@ class Publisher:
     @property
     def dependencies(self) -> Tuple['Publisher', ...]:
         """ Returning a list of publishers this publisher is dependent on. """
-        return self._dependencies
+        return tuple(self._dependencies)
 
     def add_dependencies(self, *publishers: 'Publisher') -> None:
         """ Add publishers which are directly or indirectly controlling the
@@ -237,7 +266,7 @@ class Publisher:
 
         :param *publishers: variable argument list with publishers
         """
-        self._dependencies = self._dependencies + publishers
+        self._dependencies.extend(publishers)
 
     def __dir__(self):
         """ Extending __dir__ with inherited type """
@@ -252,6 +281,10 @@ class SubscriptionDisposable(Disposable):
         :param publisher: publisher the subscription is made to
         :param subscriber: subscriber used for subscription
     """
+    # __dict__ and __weakref__ are kept to stay compatible with code setting
+    # additional attributes on or weak referencing a disposable
+    __slots__ = ('_publisher', '_subscriber', '__dict__', '__weakref__')
+
     def __init__(self, publisher: 'Publisher', subscriber: 'Subscriber') \
             -> None:
         self._publisher = publisher
@@ -42,6 +42,10 @@ class Sink(Subscriber):  # pylint: disable=too-few-public-methods
     :param unpack: value from emits will be unpacked (\\*value)
     :param \\*\\*kwargs: keyword arguments to be used for calling function
     """
+    # __dict__ and __weakref__ are kept to stay compatible with code setting
+    # additional attributes on or weak referencing a sink
+    __slots__ = ('_function', '_unpack', '__dict__', '__weakref__')
+
     def __init__(self,  # pylint: disable=keyword-arg-before-vararg
                  function: Optional[Callable[..., None]] = None,
                  *args, unpack=False, **kwargs) -> None:
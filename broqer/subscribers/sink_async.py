@@ -58,7 +58,7 @@ class SinkAsync(Subscriber):  # pylint: disable=too-few-public-methods
                                           error_callback=error_callback)
 
     def emit(self, value: Any, who: Publisher):
-        self._map_async.emit(value, who=self._dummy_publisher)
+        self._map_async.emit(value, self._dummy_publisher)
 
 
 def build_sink_async(coro=None, *, mode: AsyncMode = AsyncMode.CONCURRENT,
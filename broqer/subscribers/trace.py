@@ -19,6 +19,8 @@ class Trace(Sink):
     :param label: string to be used on output
     :param \\*\\*kwargs: keyword arguments used when calling callback
     """
+    __slots__ = ('_label',)
+
     def __init__(self,  # pylint: disable=keyword-arg-before-vararg
                  function: Optional[Callable[..., None]] = None,
                  *args, unpack=False, label=None, **kwargs) -> None:
@@ -27,7 +29,7 @@ class Trace(Sink):
 
     def emit(self, value: Any, who: 'Publisher'):
         self._trace_handler(who, value, label=self._label)
-        Sink.emit(self, value, who=who)
+        Sink.emit(self, value, who)
 
     @classmethod
     def set_handler(cls, handler):
@@ -1,6 +1,6 @@
 """ Implementing Value """
 
-from typing import Any
+from typing import Any, Iterable
 
 # pylint: disable=cyclic-import
 from broqer import Publisher, Subscriber, NONE
@@ -17,7 +17,12 @@ class Value(Publisher, Subscriber):
     0
     >>> s.emit(1)
     1
+    >>> s.emit_many([2, 3])
+    2
+    3
     """
+    __slots__ = ()
+
     def __init__(self, init=NONE):
         Publisher.__init__(self, init)
         Subscriber.__init__(self)
@@ -25,3 +30,13 @@ class Value(Publisher, Subscriber):
     def emit(self, value: Any,
              who: Publisher = None) -> None:  # pylint: disable=unused-argument
         return Publisher.notify(self, value)
+
+    def emit_many(self, values: Iterable[Any]) -> None:
+        """ Emit the given values one after another. Each value is emitted
+        to all subscribers before the next value is processed.
+
+        :param values: iterable with the values to be emitted
+        """
+        emit = self.emit
+        for value in values:
+            emit(value)
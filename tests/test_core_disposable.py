@@ -1,6 +1,7 @@
 from unittest import mock
+import weakref
 
-from broqer import Disposable, SubscriptionDisposable, Publisher, Value
+from broqer import Disposable, SubscriptionDisposable, Publisher, Value, Sink
 
 
 def test_disposable():
@@ -59,4 +60,13 @@ def test_subscription_disposable():
     assert len(p.subscriptions) == 0
 
 
+def test_subscription_disposable_weakref_and_attributes():
+    p = Publisher()
+    disposable = p.subscribe(Sink())
+
+    assert weakref.ref(disposable)() is disposable
 
+    disposable.tag = 1
+    assert disposable.tag == 1
+
+    disposable.dispose()
@@ -218,3 +218,45 @@ def test_reset_state():
     m.assert_not_called()
 
     assert p.get() == NONE
+
+
+def test_subscribe_during_notify():
+    """ Subscriptions changed during .notify() are not affecting the running
+    notification """
+    m = mock.Mock()
+    p = Publisher()
+
+    s2 = Sink(m, 2)
+    s3 = Sink(m, 3)
+
+    def _change_subscriptions(value):
+        m(1, value)
+        p.unsubscribe(s2)
+        p.subscribe(s3)
+
+    p.subscribe(Sink(_change_subscriptions))
+    p.subscribe(s2)
+
+    # s2 was subscribed when notify was called and s3 received the state on
+    # subscription
+    p.notify('test')
+    m.assert_has_calls([mock.call(1, 'test'), mock.call(3, 'test'),
+                        mock.call(2, 'test')])
+    assert p.subscriptions[1] is s3
+
+
+def test_value_emit_many():
+    class DoubleValue(Value):
+        def emit(self, value, who=None):
+            return Value.emit(self, value * 2, who)
+
+    mock_sink = mock.Mock()
+
+    v = DoubleValue()
+    v.subscribe(Sink(mock_sink))
+
+    # .emit_many is using the overridden .emit
+    v.emit_many([1, 2])
+    mock_sink.assert_has_calls([mock.call(2), mock.call(4)])
+    assert mock_sink.call_count == 2
+    assert v.get() == 4
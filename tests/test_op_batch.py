@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from unittest import mock
+
+from broqer import Sink, Publisher, op
+
+from .eventloop import VirtualTimeEventLoop
+
+
+@pytest.yield_fixture()
+def event_loop():
+    loop = VirtualTimeEventLoop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_batch(event_loop):
+    p = Publisher()
+    mock_sink = mock.Mock()
+
+    batch = p | op.Batch()
+    disposable = batch.subscribe(Sink(mock_sink))
+
+    # emits are collected until the next iteration of the event loop
+    p.notify(1)
+    p.notify(2)
+    mock_sink.assert_not_called()
+
+    await asyncio.sleep(0)
+    mock_sink.assert_called_once_with((1, 2))
+    mock_sink.reset_mock()
+
+    p.notify(3)
+    await asyncio.sleep(0)
+    mock_sink.assert_called_once_with((3,))
+    mock_sink.reset_mock()
+
+    # nothing is emitted without new values
+    await asyncio.sleep(0)
+    mock_sink.assert_not_called()
+
+    disposable.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_coalesce(event_loop):
+    p = Publisher()
+    mock_sink = mock.Mock()
+
+    batch = p | op.Batch(coalesce=True)
+    disposable = batch.subscribe(Sink(mock_sink))
+
+    p.notify(1)
+    p.notify(2)
+    p.notify(3)
+
+    await asyncio.sleep(0)
+    mock_sink.assert_called_once_with(3)
+
+    disposable.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_unsubscribe(event_loop):
+    p = Publisher()
+    mock_sink = mock.Mock()
+
+    batch = p | op.Batch()
+    disposable = batch.subscribe(Sink(mock_sink))
+
+    p.notify(1)
+    disposable.dispose()
+
+    # the collected batch is dropped on unsubscribe
+    await asyncio.sleep(0)
+    mock_sink.assert_not_called()
+
+    disposable = batch.subscribe(Sink(mock_sink))
+    p.notify(2)
+
+    # the state of p is emitted on subscription and is part of the batch
+    await asyncio.sleep(0)
+    mock_sink.assert_called_once_with((1, 2))
+
+    disposable.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_errorhandler(event_loop):
+    from broqer import default_error_handler
+
+    p = Publisher()
+    mock_sink = mock.Mock(side_effect=ZeroDivisionError('FAIL'))
+    mock_error_handler = mock.Mock()
+
+    default_error_handler.set(mock_error_handler)
+
+    batch = p | op.Batch()
+    disposable = batch.subscribe(Sink(mock_sink))
+
+    p.notify(1)
+    await asyncio.sleep(0)
+
+    mock_error_handler.assert_called_once_with(ZeroDivisionError, mock.ANY,
+                                               mock.ANY)
+
+    default_error_handler.reset()
+    disposable.dispose()
@@ -99,3 +99,14 @@ def test_unsubscibe(subscribe):
 
     p2.notify(2)
     assert operator.get() == (1, 2)
+
+
+def test_get_with_overloaded_eq():
+    """ .get() should not compare the states for equality with NONE """
+    class Ambiguous:
+        def __eq__(self, other):
+            raise ValueError('Comparison not supported')
+
+    value = Ambiguous()
+    operator = op.CombineLatest(Publisher(value), Publisher(1))
+    assert operator.get() == (value, 1)
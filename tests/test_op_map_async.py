@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from unittest import mock
+
+from broqer import Sink, Publisher, op
+
+from .eventloop import VirtualTimeEventLoop
+
+
+@pytest.yield_fixture()
+def event_loop():
+    loop = VirtualTimeEventLoop()
+    yield loop
+    loop.close()
+
+
+class SelfComparisonCounter:
+    """ Records each comparison with itself to detect the identity check """
+    def __init__(self):
+        self.self_comparisons = 0
+
+    def __eq__(self, other):
+        if other is self:
+            self.self_comparisons += 1
+        return False
+
+
+@pytest.mark.asyncio
+async def test_last_distinct_identity(event_loop):
+    p = Publisher()
+    mock_sink = mock.Mock()
+    mock_scheduled = mock.Mock()
+
+    async def _coro(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    map_async = p | op.MapAsync(_coro, mode=op.AsyncMode.LAST_DISTINCT)
+    disposable = map_async.subscribe(Sink(mock_sink))
+    map_async.scheduled.subscribe(Sink(mock_scheduled))
+
+    value = SelfComparisonCounter()
+
+    # the same object emitted while the coroutine is running is queued and
+    # afterwards skipped without being compared for equality
+    p.notify(value)
+    p.notify(value)
+
+    await asyncio.sleep(0.3)
+    assert value.self_comparisons == 0
+    mock_scheduled.assert_called_once_with(value)
+    mock_sink.assert_called_once_with(value)
+
+    # the same nan object is not distinct anymore
+    nan = float('nan')
+    mock_scheduled.reset_mock()
+
+    p.notify(nan)
+    p.notify(nan)
+
+    await asyncio.sleep(0.3)
+    mock_scheduled.assert_called_once_with(nan)
+
+    disposable.dispose()
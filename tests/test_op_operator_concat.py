@@ -1,4 +1,5 @@
 from unittest import mock
+import pytest
 
 from broqer import Publisher, NONE, Sink
 from broqer.op import Concat, Map
@@ -26,3 +27,61 @@ def test_operator_concat():
          mock.call(3.0)])
 
     assert o.get() == 3.0
+
+
+def test_operator_concat_fused_map():
+    DUT = Concat(Map(lambda v: v * 2), Map(lambda v: NONE if v > 4 else v),
+                 Map(lambda v: (v, v + 1)),
+                 Map(lambda a, b: a - b, unpack=True))
+    mock_cb = mock.Mock()
+
+    p = Publisher()
+
+    o = p | DUT
+
+    # the successive maps are fused into one operator
+    assert o.dependencies == (p,)
+    assert o.get() == NONE
+
+    o.subscribe(Sink(mock_cb))
+
+    for v in range(5):
+        p.notify(v)
+
+    # result of the second map is stopping the chain when it's NONE
+    mock_cb.assert_has_calls([mock.call(-1), mock.call(-1), mock.call(-1)])
+    assert mock_cb.call_count == 3
+
+
+def test_map_fusion():
+    DUT = Map(lambda v: v + 1) | Map(lambda v: v * 2)
+    assert isinstance(DUT, Map)
+
+    p = Publisher(1)
+    assert (p | DUT).get() == 4
+
+
+def test_fused_map_unpack_non_sequence():
+    # like chained maps the fused map is only unpacking sequences
+    DUT = Concat(Map(str.upper), Map(lambda a, b: a + '-' + b, unpack=True))
+
+    p = Publisher('ab')
+
+    with pytest.raises(AssertionError):
+        (p | DUT).get()
+
+    with pytest.raises(AssertionError):
+        (p | Map(str.upper) | Map(lambda a, b: a + '-' + b, unpack=True)).get()
+
+
+def test_map_subclass_not_fused():
+    class MyMap(Map):
+        def apply(self, publisher):
+            return Map.apply(self, publisher | Map(lambda v: v + 1))
+
+    p = Publisher(1)
+
+    assert (p | Concat(Map(lambda v: v * 2), MyMap(lambda v: v * 3))).get() \
+        == 9
+    assert (p | Concat(MyMap(lambda v: v * 3), Map(lambda v: v * 2))).get() \
+        == 12
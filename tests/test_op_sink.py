@@ -1,4 +1,5 @@
 from unittest import mock
+import weakref
 import pytest
 
 from broqer import Disposable, Publisher, Value, Sink, Trace, build_sink, \
@@ -165,3 +166,13 @@ def test_build(build_kwargs, init_args, init_kwargs, ref_args, ref_kwargs,
 
     assert mock_cb.mock_calls == ref_mock_cb.mock_calls
     assert len(mock_cb.mock_calls) == 1
+
+
+@pytest.mark.parametrize('operator_cls', [Sink, Trace])
+def test_sink_weakref_and_attributes(operator_cls):
+    dut = operator_cls()
+
+    assert weakref.ref(dut)() is dut
+
+    dut.tag = 1
+    assert dut.tag == 1